@@ -83,13 +83,16 @@ class GridStrike(ControllerBase):
             if executor.is_active
         ]
 
+    def has_active_executor(self) -> bool:
+        return any(executor.is_active for executor in self.executors_info)
+
     def is_inside_bounds(self, price: Decimal) -> bool:
         return self.config.start_price <= price <= self.config.end_price
 
     def determine_executor_actions(self) -> List[ExecutorAction]:
         mid_price = self.market_data_provider.get_price_by_type(
             self.config.connector_name, self.config.trading_pair, PriceType.MidPrice)
-        if len(self.active_executors()) == 0 and self.is_inside_bounds(mid_price):
+        if not self.has_active_executor() and self.is_inside_bounds(mid_price):
             return [CreateExecutorAction(
                 controller_id=self.config.id,
                 executor_config=GridExecutorConfig(
@@ -13,13 +13,17 @@ DEFAULT_FEES = TradeFeeSchema(
     taker_percent_fee_decimal=Decimal("0.0005"),
 )
 
+_API_KEY_PROMPT = f"Enter your {CONSTANTS.EXCHANGE_NAME} API key"
+_SECRET_KEY_PROMPT = f"Enter your {CONSTANTS.EXCHANGE_NAME} secret key"
+_USER_ID_PROMPT = f"Enter your {CONSTANTS.EXCHANGE_NAME} user id"
+
 
 class GateIOPerpetualConfigMap(BaseConnectorConfigMap):
     connector: str = Field(default="gate_io_perpetual", client_data=None)
     gate_io_perpetual_api_key: SecretStr = Field(
         default=...,
         client_data=ClientFieldData(
-            prompt=lambda cm: f"Enter your {CONSTANTS.EXCHANGE_NAME} API key",
+            prompt=lambda cm: _API_KEY_PROMPT,
             is_secure=True,
             is_connect_key=True,
             prompt_on_new=True,
@@ -28,7 +32,7 @@ class GateIOPerpetualConfigMap(BaseConnectorConfigMap):
     gate_io_perpetual_secret_key: SecretStr = Field(
         default=...,
         client_data=ClientFieldData(
-            prompt=lambda cm: f"Enter your {CONSTANTS.EXCHANGE_NAME} secret key",
+            prompt=lambda cm: _SECRET_KEY_PROMPT,
             is_secure=True,
             is_connect_key=True,
             prompt_on_new=True,
@@ -37,7 +41,7 @@ class GateIOPerpetualConfigMap(BaseConnectorConfigMap):
     gate_io_perpetual_user_id: SecretStr = Field(
         default=...,
         client_data=ClientFieldData(
-            prompt=lambda cm: f"Enter your {CONSTANTS.EXCHANGE_NAME} user id",
+            prompt=lambda cm: _USER_ID_PROMPT,
             is_secure=True,
             is_connect_key=True,
             prompt_on_new=True,
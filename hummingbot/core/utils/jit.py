@@ -0,0 +1,30 @@
+"""
+Optional Numba support.
+
+Numba is not a dependency of Hummingbot, neither setup.py nor the conda environment installs it. Numeric kernels
+decorate themselves with ``njit`` from this module; the compiled path is opt-in: when Numba is installed
+(``pip install numba``) they are compiled to native code, otherwise the decorator is a no-op and the plain Python
+implementation is used.
+"""
+
+try:
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - exercised only when numba is not installed
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for ``numba.njit`` supporting both ``@njit`` and ``@njit(...)``."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(fn):
+            return fn
+
+        return decorator
+
+    prange = range
+
+
+__all__ = ["NUMBA_AVAILABLE", "njit", "prange"]
@@ -1,17 +1,18 @@
-from decimal import Decimal
 import logging
-from typing import Dict, List, Tuple, Optional
-import numpy as np
-import pandas as pd
+import math
+from decimal import Decimal
+from typing import List, Optional, Tuple
 
-from hummingbot.core.data_type.common import OrderType, PriceType, TradeType
+from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.order_candidate import OrderCandidate
-from hummingbot.strategy.market_making_strategy_base import MarketMakingStrategyBase
 from hummingbot.core.event.events import OrderFilledEvent
-from hummingbot.core.data_type.limit_order import LimitOrder
-from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 from hummingbot.logger import HummingbotLogger
+from hummingbot.strategy.cm_williams_vix_maker.vix_history import VixHistory
+from hummingbot.strategy.cm_williams_vix_maker.vix_kernel import warm_up
+from hummingbot.strategy.market_making_strategy_base import MarketMakingStrategyBase
+from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 
+s_decimal_zero = Decimal(0)
 logger = None
 
 class CMWilliamsVixMaker(MarketMakingStrategyBase):
@@ -45,6 +46,8 @@ class CMWilliamsVixMaker(MarketMakingStrategyBase):
                  status_report_interval: float = 900):
         super().__init__()
         self._market_info = market_info
+        self._market = market_info.market
+        self._trading_pair = market_info.trading_pair
         self._min_spread = min_spread
         self._max_spread = max_spread
         self._order_amount = order_amount
@@ -64,140 +67,101 @@ class CMWilliamsVixMaker(MarketMakingStrategyBase):
         self._stop_loss_spread = stop_loss_spread
         self._take_profit_spread = take_profit_spread
         self._position_cooling_off = position_cooling_off
-        
+
+        # Float mirrors of the spread parameters, prices are converted back to Decimal only when proposed
+        adj_low = min(max(min_spread * low_volatility_multiplier, min_spread), max_spread)
+        adj_high = min(max(min_spread * high_volatility_multiplier, min_spread), max_spread)
+        # is_high_volatility -> (buy price factor, sell price factor)
+        self._price_factors = {
+            False: (float(1 - adj_low), float(1 + adj_low)),
+            True: (float(1 - adj_high), float(1 + adj_high)),
+        }
+        self._stop_loss_spread_f = float(stop_loss_spread)
+        # Filled side -> (exit side, stop loss price factor, take profit price factor)
+        self._exit_factors = {
+            TradeType.BUY: (TradeType.SELL, float(1 - stop_loss_spread), float(1 + take_profit_spread)),
+            TradeType.SELL: (TradeType.BUY, float(1 + stop_loss_spread), float(1 - take_profit_spread)),
+        }
+
+        # OrderCandidate fields that never change, only the price is set per proposal
+        self._buy_template = dict(
+            trading_pair=self._trading_pair,
+            is_maker=True,
+            order_type=OrderType.LIMIT,
+            order_side=TradeType.BUY,
+            amount=order_amount,
+        )
+        self._sell_template = dict(self._buy_template, order_side=TradeType.SELL)
+
         # Internal tracking
-        self._price_history = []
-        self._vix_history = []
+        # Price and VIX histories, the VIX of each price is calculated once
+        self._vix_history = VixHistory(lookback_period, bb_length, bb_std)
         self._last_trade_price = None
         self._last_timestamp = 0
         self._logging_options = logging_options
         self._status_report_interval = status_report_interval
         self._last_position_check_timestamp = 0
         self._current_timestamp = 0
+        # Mid price and position read once per tick, shared by every step of the tick
+        self._cached_price: Optional[Decimal] = None
+        self._cached_position = None
+        # Only derivative connectors hold positions, spot connectors have no get_position
+        self._has_positions = hasattr(self._market, "get_position")
         
         self.add_markets([market_info.market])
+        # Pay the JIT compilation when the strategy is created rather than on the first tick
+        warm_up()
 
     def calculate_cm_williams_vix(self) -> Tuple[float, bool]:
         """
         Calculate CM Williams VIX Fix indicator
         Returns: (vix_value, is_high_volatility)
         """
-        try:
-            if len(self._price_history) < self._lookback_period:
-                return 0.0, False
-
-            # Convert price history to numpy array for calculations
-            prices = np.array(self._price_history[-self._lookback_period:])
-            if len(prices) == 0:
-                return 0.0, False
-
-            highest_close = np.max(prices)
-            if highest_close == 0:
-                return 0.0, False
-
-            current_low = prices[-1]
-
-            # Calculate Williams VIX Fix
-            wvf = ((highest_close - current_low) / highest_close) * 100
+        return self._vix_history.calculate()
 
-            # Calculate Bollinger Bands on VIX
-            if len(self._vix_history) >= self._bb_length:
-                vix_values = np.array(self._vix_history[-self._bb_length:])
-                mid_line = np.mean(vix_values)
-                std_dev = np.std(vix_values)
-                upper_band = mid_line + (self._bb_std * std_dev)
-                
-                # Signal high volatility if WVF crosses above upper band
-                is_high_volatility = wvf > upper_band
-                
-                self._vix_history.append(wvf)
-                return float(wvf), is_high_volatility
-            
-            self._vix_history.append(wvf)
-            return float(wvf), False
-        except Exception as e:
-            self.logger().error(f"Error calculating VIX: {str(e)}", exc_info=True)
-            return 0.0, False
-
-    def get_spread_multiplier(self, is_high_volatility: bool) -> Decimal:
-        """Adjust spread based on volatility"""
-        return self._high_volatility_multiplier if is_high_volatility else self._low_volatility_multiplier
+    def _to_order_price(self, price: float) -> Decimal:
+        """Convert a float price to a Decimal quantized to the market's price increment"""
+        return self._market.quantize_order_price(self._trading_pair, Decimal(repr(price)))
 
     def get_price(self) -> Optional[Decimal]:
         """Get the current price safely"""
         try:
             price = self._market_info.get_mid_price()
-            return price if price and price > Decimal('0') else None
+            return price if price and price > s_decimal_zero else None
         except Exception:
             return None
 
     def create_order_proposals(self) -> Tuple[List[OrderCandidate], List[OrderCandidate]]:
         """Create buy and sell proposals based on market making parameters and VIX readings"""
-        if not self._market_info.market.ready:
-            return [], []
-
         # Get reference price
-        ref_price = self.get_price()
-        if ref_price is None:
+        ref_price = self._cached_price
+        if not self._market.ready or ref_price is None:
             return [], []
 
-        try:
-            # Update price history and calculate VIX
-            self._price_history.append(float(ref_price))
-            # Trim price history to prevent memory growth
-            if len(self._price_history) > max(self._lookback_period * 2, self._bb_length * 2):
-                self._price_history = self._price_history[-self._lookback_period:]
-            
-            vix, is_high_volatility = self.calculate_cm_williams_vix()
-            
-            # Adjust spread based on volatility
-            spread_multiplier = self.get_spread_multiplier(is_high_volatility)
-            adjusted_spread = min(
-                max(self._min_spread * spread_multiplier, self._min_spread),
-                self._max_spread
-            )
-            
-            # Calculate order prices
-            buy_price = ref_price * (Decimal("1") - adjusted_spread)
-            sell_price = ref_price * (Decimal("1") + adjusted_spread)
-            
-            # Create proposals
-            buy_proposals = []
-            sell_proposals = []
-            
-            # Check position limits
-            current_position = self._market_info.market.get_position(self._market_info.trading_pair)
-            position_size = abs(current_position.amount) if current_position else Decimal("0")
-            
-            if position_size < self._max_position_size:
-                # Create buy order
-                buy_proposals.append(
-                    OrderCandidate(
-                        trading_pair=self._market_info.trading_pair,
-                        is_maker=True,
-                        order_type=OrderType.LIMIT,
-                        order_side=TradeType.BUY,
-                        amount=self._order_amount,
-                        price=buy_price
-                    )
-                )
-                
-                # Create sell order
-                sell_proposals.append(
-                    OrderCandidate(
-                        trading_pair=self._market_info.trading_pair,
-                        is_maker=True,
-                        order_type=OrderType.LIMIT,
-                        order_side=TradeType.SELL,
-                        amount=self._order_amount,
-                        price=sell_price
-                    )
-                )
-            
-            return buy_proposals, sell_proposals
-        except Exception as e:
-            self.logger().error(f"Error creating proposals: {str(e)}", exc_info=True)
-            return [], []
+        # Update price history and calculate VIX
+        ref_price_f = float(ref_price)
+        self._vix_history.append_price(ref_price_f)
+
+        vix, is_high_volatility = self.calculate_cm_williams_vix()
+
+        # Calculate order prices, the spread is adjusted based on volatility
+        buy_factor, sell_factor = self._price_factors[is_high_volatility]
+        buy_price = self._to_order_price(ref_price_f * buy_factor)
+        sell_price = self._to_order_price(ref_price_f * sell_factor)
+
+        # Create proposals
+        buy_proposals = []
+        sell_proposals = []
+
+        # Check position limits
+        current_position = self._cached_position
+        position_size = abs(current_position.amount) if current_position else s_decimal_zero
+
+        if position_size < self._max_position_size:
+            buy_proposals.append(OrderCandidate(price=buy_price, **self._buy_template))
+            sell_proposals.append(OrderCandidate(price=sell_price, **self._sell_template))
+
+        return buy_proposals, sell_proposals
 
     def place_order(self, market_info, order_type, amount, order_type_str, price) -> str:
         """Place an order and return the order id"""
@@ -223,71 +187,46 @@ class CMWilliamsVixMaker(MarketMakingStrategyBase):
             self._last_trade_price = event.price
             
             # Create stop loss and take profit orders
-            if event.trade_type == TradeType.BUY:
-                stop_loss_price = event.price * (Decimal("1") - self._stop_loss_spread)
-                take_profit_price = event.price * (Decimal("1") + self._take_profit_spread)
-                
-                # Place stop loss sell order
-                self.place_order(
-                    self._market_info,
-                    TradeType.SELL,
-                    event.amount,
-                    OrderType.STOP,
-                    stop_loss_price
-                )
-                
-                # Place take profit sell order
-                self.place_order(
-                    self._market_info,
-                    TradeType.SELL,
-                    event.amount,
-                    OrderType.LIMIT,
-                    take_profit_price
-                )
-            else:  # SELL
-                stop_loss_price = event.price * (Decimal("1") + self._stop_loss_spread)
-                take_profit_price = event.price * (Decimal("1") - self._take_profit_spread)
-                
-                # Place stop loss buy order
-                self.place_order(
-                    self._market_info,
-                    TradeType.BUY,
-                    event.amount,
-                    OrderType.STOP,
-                    stop_loss_price
-                )
-                
-                # Place take profit buy order
-                self.place_order(
-                    self._market_info,
-                    TradeType.BUY,
-                    event.amount,
-                    OrderType.LIMIT,
-                    take_profit_price
-                )
+            exit_side, stop_loss_factor, take_profit_factor = self._exit_factors[event.trade_type]
+            fill_price = float(event.price)
+            self._emit_exit_pair(
+                event.amount,
+                exit_side,
+                self._to_order_price(fill_price * stop_loss_factor),
+                self._to_order_price(fill_price * take_profit_factor)
+            )
         except Exception as e:
             self.logger().error(f"Error handling filled order: {str(e)}", exc_info=True)
 
+    def _emit_exit_pair(self, amount: Decimal, exit_side: TradeType, stop_loss_price: Decimal,
+                        take_profit_price: Decimal):
+        """Place the stop loss and take profit orders closing a filled order"""
+        self.place_order(self._market_info, exit_side, amount, OrderType.STOP, stop_loss_price)
+        self.place_order(self._market_info, exit_side, amount, OrderType.LIMIT, take_profit_price)
+
     def check_and_cancel_active_orders(self):
         """Check and cancel active orders based on market conditions"""
         if not self.active_orders:
             return
         
         try:
-            current_tick = self._current_timestamp
+            # Runs before this tick's price is recorded, so this is the reading the active orders were proposed with
             vix, is_high_volatility = self.calculate_cm_williams_vix()
-            
+            # Reference price and thresholds are the same for every order within a tick
+            refresh_cutoff = self._current_timestamp - self._order_refresh_time
+            current_price = self._cached_price
+            current_price_f = float(current_price) if current_price else 0.0
+            # abs(price - current) / current > spread, rearranged so no division is needed per order
+            max_price_change = current_price_f * self._stop_loss_spread_f if current_price else math.inf
+            market_info = self._market_info
+
             for order in self.active_orders:
                 # Cancel orders in high volatility if they've been active too long
-                if is_high_volatility and (current_tick - order.timestamp) > self._order_refresh_time:
-                    self.cancel_order(self._market_info, order.client_order_id)
-                
+                expired = is_high_volatility and order.timestamp < refresh_cutoff
                 # Cancel orders if price moved significantly
-                current_price = self.get_price()
-                if current_price:
-                    price_change = abs(order.price - current_price) / current_price
-                    if price_change > self._stop_loss_spread:
-                        self.cancel_order(self._market_info, order.client_order_id)
+                moved = abs(float(order.price) - current_price_f) > max_price_change
+                if expired or moved:
+                    self.cancel_order(market_info, order.client_order_id)
         except Exception as e:
             self.logger().error(f"Error checking active orders: {str(e)}", exc_info=True)
 
@@ -296,23 +235,25 @@ class CMWilliamsVixMaker(MarketMakingStrategyBase):
         Clock tick entry point.
         :param timestamp: current tick timestamp
         """
-        try:
-            super().tick(timestamp)
-            
-            # Store timestamp for internal logic
-            self._current_timestamp = timestamp
-            
-            # Check and cancel active orders
-            self.check_and_cancel_active_orders()
-            
-            # Create new order proposals
-            self.process_tick()
-            
-            # Log status
-            if self._should_report_status(timestamp):
-                self.report_status()
-        except Exception as e:
-            self.logger().error(f"Error running tick: {str(e)}", exc_info=True)
+        super().tick(timestamp)
+
+        # Store timestamp for internal logic
+        self._current_timestamp = timestamp
+        self._cached_price = self.get_price()
+        market = self._market
+        self._cached_position = (market.get_position(self._trading_pair)
+                                 if self._has_positions and market.ready else None)
+
+        # Check and cancel active orders
+        self.check_and_cancel_active_orders()
+
+        # Create new order proposals
+        self.process_tick()
+        self._vix_history.commit()
+
+        # Log status, report_status logs its own errors
+        if self._should_report_status(timestamp):
+            self.report_status()
 
     def _should_report_status(self, timestamp: float) -> bool:
         """Determine if status should be reported"""
@@ -320,15 +261,16 @@ class CMWilliamsVixMaker(MarketMakingStrategyBase):
 
     def report_status(self):
         """Report strategy status"""
-        if not self._market_info.market.ready:
+        # Nothing to gather when the status line would be dropped
+        if not self._market.ready or not self.logger().isEnabledFor(logging.INFO):
             return
 
         try:
             # Get current market status
             active_orders = len(self.active_orders)
-            current_price = self.get_price()
-            position = self._market_info.market.get_position(self._market_info.trading_pair)
-            position_size = position.amount if position else Decimal("0")
+            current_price = self._cached_price
+            position = self._cached_position
+            position_size = position.amount if position else s_decimal_zero
             
             # Calculate VIX status
             vix, is_high_volatility = self.calculate_cm_williams_vix()
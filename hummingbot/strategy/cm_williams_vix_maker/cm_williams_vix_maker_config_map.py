@@ -14,12 +14,14 @@ from hummingbot.client.settings import (
     AllConnectorSettings,
 )
 
+
 def trading_pair_prompt():
     exchange = cm_williams_vix_maker_config_map.get("exchange").value
     example = AllConnectorSettings.get_example_pairs().get(exchange)
     return "Enter the trading pair you would like to trade on %s%s >>> " \
            % (exchange, f" (e.g. {example})" if example else "")
 
+
 # Strategy specific validation functions
 def validate_decimal_0_1(value: str) -> Optional[str]:
     try:
@@ -30,6 +32,7 @@ def validate_decimal_0_1(value: str) -> Optional[str]:
         return f"{value} is not a valid decimal."
     return None
 
+
 def validate_positive_decimal(value: str) -> Optional[str]:
     try:
         decimal_value = Decimal(value)
@@ -39,6 +42,43 @@ def validate_positive_decimal(value: str) -> Optional[str]:
         return f"{value} is not a valid decimal."
     return None
 
+
+def validate_pct(value: str) -> Optional[str]:
+    return validate_decimal(value, 0, 100, inclusive=False)
+
+
+def validate_positive_number(value: str) -> Optional[str]:
+    return validate_decimal(value, min_value=0.0, inclusive=False)
+
+
+def validate_optional_positive_number(value: str) -> Optional[str]:
+    return validate_positive_number(value) if value is not None else None
+
+
+def validate_positive_int(value: str) -> Optional[str]:
+    return validate_int(value, min_value=1)
+
+
+def validate_non_negative_int(value: str) -> Optional[str]:
+    return validate_int(value, min_value=0)
+
+
+def validate_high_volatility_multiplier(value: str) -> Optional[str]:
+    return validate_decimal(value, min_value=1.0, inclusive=True)
+
+
+def validate_low_volatility_multiplier(value: str) -> Optional[str]:
+    return validate_decimal(value, min_value=0.0, max_value=1.0, inclusive=True)
+
+
+def validate_risk_factor(value: str) -> Optional[str]:
+    return validate_decimal(value, min_value=0.1, max_value=1.0, inclusive=True)
+
+
+def validate_logging_options(value: str) -> Optional[str]:
+    return validate_int(value, 1, 2)
+
+
 cm_williams_vix_maker_config_map = {
     "strategy": ConfigVar(
         key="strategy",
@@ -72,7 +112,7 @@ cm_williams_vix_maker_config_map = {
         prompt="What is the minimum spread between orders (enter 1 for 1%)? >>> ",
         type_str="decimal",
         default=Decimal("1.0"),
-        validator=lambda v: validate_decimal(v, 0, 100, inclusive=False),
+        validator=validate_pct,
         prompt_on_new=True,
     ),
     "max_spread": ConfigVar(
@@ -80,7 +120,7 @@ cm_williams_vix_maker_config_map = {
         prompt="What is the maximum spread between orders (enter 1 for 1%)? >>> ",
         type_str="decimal",
         default=Decimal("5.0"),
-        validator=lambda v: validate_decimal(v, 0, 100, inclusive=False),
+        validator=validate_pct,
         prompt_on_new=True,
     ),
     # VIX Parameters
@@ -89,7 +129,7 @@ cm_williams_vix_maker_config_map = {
         prompt="Enter lookback period for VIX calculation >>> ",
         type_str="int",
         default=22,
-        validator=lambda v: validate_int(v, min_value=1),
+        validator=validate_positive_int,
         prompt_on_new=True,
     ),
     "bb_length": ConfigVar(
@@ -97,7 +137,7 @@ cm_williams_vix_maker_config_map = {
         prompt="Enter Bollinger Band length >>> ",
         type_str="int",
         default=20,
-        validator=lambda v: validate_int(v, min_value=1),
+        validator=validate_positive_int,
         prompt_on_new=True,
     ),
     "bb_std": ConfigVar(
@@ -105,7 +145,7 @@ cm_williams_vix_maker_config_map = {
         prompt="Enter Bollinger Band standard deviation multiplier >>> ",
         type_str="float",
         default=2.0,
-        validator=lambda v: validate_decimal(v, min_value=0.0, inclusive=False),
+        validator=validate_positive_number,
         prompt_on_new=True,
     ),
     "high_volatility_multiplier": ConfigVar(
@@ -113,7 +153,7 @@ cm_williams_vix_maker_config_map = {
         prompt="Enter spread multiplier for high volatility (e.g. 1.5 for 150% of min_spread) >>> ",
         type_str="decimal",
         default=Decimal("1.5"),
-        validator=lambda v: validate_decimal(v, min_value=1.0, inclusive=True),
+        validator=validate_high_volatility_multiplier,
         prompt_on_new=True,
     ),
     "low_volatility_multiplier": ConfigVar(
@@ -121,7 +161,7 @@ cm_williams_vix_maker_config_map = {
         prompt="Enter spread multiplier for low volatility (e.g. 0.5 for 50% of min_spread) >>> ",
         type_str="decimal",
         default=Decimal("0.5"),
-        validator=lambda v: validate_decimal(v, min_value=0.0, max_value=1.0, inclusive=True),
+        validator=validate_low_volatility_multiplier,
         prompt_on_new=True,
     ),
     # Trend Analysis Parameters
@@ -130,7 +170,7 @@ cm_williams_vix_maker_config_map = {
         prompt="Enter short-term EMA period >>> ",
         type_str="int",
         default=9,
-        validator=lambda v: validate_int(v, min_value=1),
+        validator=validate_positive_int,
         prompt_on_new=True,
     ),
     "ema_long": ConfigVar(
@@ -138,7 +178,7 @@ cm_williams_vix_maker_config_map = {
         prompt="Enter long-term EMA period >>> ",
         type_str="int",
         default=21,
-        validator=lambda v: validate_int(v, min_value=1),
+        validator=validate_positive_int,
         prompt_on_new=True,
     ),
     "trend_strength_threshold": ConfigVar(
@@ -146,7 +186,7 @@ cm_williams_vix_maker_config_map = {
         prompt="Enter trend strength threshold (e.g. 0.02 for 2%) >>> ",
         type_str="decimal",
         default=Decimal("0.02"),
-        validator=lambda v: validate_decimal(v, min_value=0.0, inclusive=False),
+        validator=validate_positive_number,
         prompt_on_new=True,
     ),
     # Risk Management Parameters
@@ -156,14 +196,14 @@ cm_williams_vix_maker_config_map = {
         type_str="decimal",
         required_if=lambda: False,
         default=None,
-        validator=lambda v: validate_decimal(v, min_value=0.0, inclusive=False) if v is not None else None,
+        validator=validate_optional_positive_number,
     ),
     "stop_loss_spread": ConfigVar(
         key="stop_loss_spread",
         prompt="At what spread from entry price to place stop loss orders (enter 5 for 5%)? >>> ",
         type_str="decimal",
         default=Decimal("5.0"),
-        validator=lambda v: validate_decimal(v, 0, 100, inclusive=False),
+        validator=validate_pct,
         prompt_on_new=True,
     ),
     "take_profit_spread": ConfigVar(
@@ -171,7 +211,7 @@ cm_williams_vix_maker_config_map = {
         prompt="At what spread from entry price to place take profit orders (enter 2 for 2%)? >>> ",
         type_str="decimal",
         default=Decimal("2.0"),
-        validator=lambda v: validate_decimal(v, 0, 100, inclusive=False),
+        validator=validate_pct,
         prompt_on_new=True,
     ),
     "dynamic_spread_adjustment": ConfigVar(
@@ -193,14 +233,14 @@ cm_williams_vix_maker_config_map = {
         prompt="Enter risk factor for position sizing (e.g. 0.5 for conservative, 1.0 for moderate) >>> ",
         type_str="decimal",
         default=Decimal("0.5"),
-        validator=lambda v: validate_decimal(v, min_value=0.1, max_value=1.0, inclusive=True),
+        validator=validate_risk_factor,
     ),
     "max_order_age": ConfigVar(
         key="max_order_age",
         prompt="Maximum time to keep orders open (in seconds) >>> ",
         type_str="float",
         default=1800.0,
-        validator=lambda v: validate_decimal(v, min_value=0.0, inclusive=False),
+        validator=validate_positive_number,
     ),
     # Advanced Order Management
     "order_refresh_time": ConfigVar(
@@ -208,7 +248,7 @@ cm_williams_vix_maker_config_map = {
         prompt="How often do you want to refresh orders (in seconds)? >>> ",
         type_str="float",
         default=30.0,
-        validator=lambda v: validate_decimal(v, min_value=0.0, inclusive=False),
+        validator=validate_positive_number,
         prompt_on_new=True,
     ),
     "filled_order_delay": ConfigVar(
@@ -216,7 +256,7 @@ cm_williams_vix_maker_config_map = {
         prompt="How long to wait before placing new orders after fills (in seconds)? >>> ",
         type_str="float",
         default=60.0,
-        validator=lambda v: validate_decimal(v, min_value=0.0, inclusive=False),
+        validator=validate_positive_number,
     ),
     "order_optimization_enabled": ConfigVar(
         key="order_optimization_enabled",
@@ -230,7 +270,7 @@ cm_williams_vix_maker_config_map = {
         prompt="How long to wait before taking new positions (in seconds)? >>> ",
         type_str="int",
         default=300,
-        validator=lambda v: validate_int(v, min_value=0),
+        validator=validate_non_negative_int,
         prompt_on_new=True,
     ),
     # Logging and Reporting
@@ -239,14 +279,14 @@ cm_williams_vix_maker_config_map = {
         prompt="Enter logging options (1 for INFO, 2 for DEBUG) >>> ",
         type_str="int",
         default=1,
-        validator=lambda v: validate_int(v, 1, 2),
+        validator=validate_logging_options,
     ),
     "status_report_interval": ConfigVar(
         key="status_report_interval",
         prompt="How often do you want to report status (in seconds) >>> ",
         type_str="float",
         default=900.0,
-        validator=lambda v: validate_decimal(v, min_value=0.0, inclusive=False),
+        validator=validate_positive_number,
     ),
 }
      
@@ -0,0 +1,90 @@
+from typing import Tuple
+
+import numpy as np
+
+from hummingbot.strategy.cm_williams_vix_maker.vix_kernel import calc_wvf_bb
+
+
+class VixHistory:
+    """
+    Price and VIX histories of the CM Williams VIX Fix, kept in ring buffers.
+    The reading of the latest price is calculated at most once, every call until the next price reuses it.
+    """
+
+    def __init__(self, lookback_period: int, bb_length: int, bb_std: float):
+        """
+        :param lookback_period: look back period for the highest close
+        :param bb_length: Bollinger Band length
+        :param bb_std: Bollinger Band standard deviation multiplier
+        """
+        self._lookback_period = lookback_period
+        self._bb_length = bb_length
+        self._bb_std = bb_std
+        self._price_buf = np.empty(lookback_period, dtype=np.float64)
+        self._price_count = 0
+        # Set once lookback_period prices are buffered, until then there is no VIX to calculate
+        self._warm = False
+        self._vix_buf = np.empty(bb_length, dtype=np.float64)
+        self._vix_count = 0
+        # (vix_value, is_high_volatility) of the latest price, and the price count it was calculated for
+        self._vix_cache = (0.0, False)
+        self._vix_cache_count = -1
+        # A price was recorded whose VIX is not yet in the VIX history
+        self._vix_pending = False
+
+    @property
+    def price_count(self) -> int:
+        """Number of prices recorded so far"""
+        return self._price_count
+
+    @property
+    def vix_count(self) -> int:
+        """Number of VIX values recorded so far"""
+        return self._vix_count
+
+    def calculate(self) -> Tuple[float, bool]:
+        """
+        CM Williams VIX Fix of the latest price
+        Returns: (vix_value, is_high_volatility), (0.0, False) until lookback_period prices are recorded
+        """
+        # Replaced on the instance by _calc_steady once the price history is warm
+        if not self._warm:
+            return 0.0, False
+        return self._calc_steady()
+
+    def _calc_steady(self) -> Tuple[float, bool]:
+        """calculate once lookback_period prices are buffered"""
+        if self._vix_cache_count == self._price_count:
+            return self._vix_cache
+        wvf, _, is_high_volatility = calc_wvf_bb(
+            self._price_buf, self._price_count,
+            self._vix_buf, self._vix_count,
+            self._lookback_period, self._bb_length, self._bb_std
+        )
+        self._vix_cache = (float(wvf), bool(is_high_volatility))
+        self._vix_cache_count = self._price_count
+        return self._vix_cache
+
+    def append_price(self, price: float):
+        """Write a price into the price ring buffer"""
+        self._price_buf[self._price_count % self._lookback_period] = price
+        self._price_count += 1
+        self._vix_pending = True
+        if not self._warm and self._price_count >= self._lookback_period:
+            self._warm = True
+            self.calculate = self._calc_steady
+
+    def commit(self):
+        """
+        Record the VIX of the latest price, exactly once per recorded price.
+        The cached reading of that price is kept, so calls until the next price still return the same reading.
+        """
+        if self._vix_pending:
+            self._vix_pending = False
+            if self._warm:
+                self._append_vix(self.calculate()[0])
+
+    def _append_vix(self, vix: float):
+        """Write a VIX value into the VIX ring buffer"""
+        self._vix_buf[self._vix_count % self._bb_length] = vix
+        self._vix_count += 1
@@ -0,0 +1,128 @@
+import math
+from typing import Tuple
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from hummingbot.core.utils.jit import njit, prange
+
+
+@njit(cache=True, fastmath=True)
+def calc_wvf_bb(price_buf: np.ndarray,
+                price_count: int,
+                vix_buf: np.ndarray,
+                vix_count: int,
+                lookback: int,
+                bb_length: int,
+                bb_std: float) -> Tuple[float, float, bool]:
+    """
+    Calculates the Williams VIX Fix of the latest price and the upper Bollinger Band of the previous VIX values.
+    Both histories are ring buffers: value number ``i`` (0 based, in insertion order) is stored at ``i % len(buf)``.
+    Compiled only when Numba is installed, which is opt-in, the plain Python loop runs otherwise.
+    :param price_buf: price ring buffer, at least ``lookback`` long
+    :param price_count: number of prices written so far, at least ``lookback``
+    :param vix_buf: VIX ring buffer, at least ``bb_length`` long, not including the value being calculated
+    :param vix_count: number of VIX values written so far
+    :param lookback: look back period for the highest close
+    :param bb_length: Bollinger Band length
+    :param bb_std: Bollinger Band standard deviation multiplier
+    :return: (wvf, upper_band, is_high_volatility), upper_band is 0 until ``bb_length`` VIX values are available
+    """
+    n = price_buf.shape[0]
+    start = price_count - lookback
+    highest_close = price_buf[start % n]
+    for i in range(start + 1, price_count):
+        price = price_buf[i % n]
+        if price > highest_close:
+            highest_close = price
+    if highest_close == 0.0:
+        return 0.0, 0.0, False
+    wvf = (highest_close - price_buf[(price_count - 1) % n]) / highest_close * 100.0
+
+    if vix_count < bb_length:
+        return wvf, 0.0, False
+    m = vix_buf.shape[0]
+    start = vix_count - bb_length
+    # Welford's algorithm, mean and (population) standard deviation in a single pass
+    mean = 0.0
+    m2 = 0.0
+    for i in range(bb_length):
+        x = vix_buf[(start + i) % m]
+        delta = x - mean
+        mean += delta / (i + 1)
+        m2 += delta * (x - mean)
+    upper_band = mean + bb_std * math.sqrt(m2 / bb_length)
+    return wvf, upper_band, wvf > upper_band
+
+
+@njit(parallel=True, cache=True)
+def calc_wvf_bb_batch(price_bufs: np.ndarray,
+                      price_counts: np.ndarray,
+                      vix_bufs: np.ndarray,
+                      vix_counts: np.ndarray,
+                      lookback: int,
+                      bb_length: int,
+                      bb_std: float,
+                      out_wvf: np.ndarray,
+                      out_upper_band: np.ndarray,
+                      out_is_high: np.ndarray):
+    """
+    ``calc_wvf_bb`` for several trading pairs at once, the pairs are processed in parallel when Numba is installed.
+    Without Numba (the default install) the pairs are processed one after another in Python.
+    Row ``k`` of the 2D buffers and element ``k`` of the other arrays belong to pair ``k``.
+    :param price_bufs: price ring buffers, one row per pair
+    :param price_counts: number of prices written so far per pair, at least ``lookback``
+    :param vix_bufs: VIX ring buffers, one row per pair
+    :param vix_counts: number of VIX values written so far per pair
+    :param lookback: look back period for the highest close
+    :param bb_length: Bollinger Band length
+    :param bb_std: Bollinger Band standard deviation multiplier
+    :param out_wvf: receives the wvf per pair
+    :param out_upper_band: receives the upper band per pair
+    :param out_is_high: receives the high volatility flag per pair
+    """
+    for k in prange(price_bufs.shape[0]):
+        wvf, upper_band, is_high = calc_wvf_bb(price_bufs[k], price_counts[k], vix_bufs[k], vix_counts[k],
+                                               lookback, bb_length, bb_std)
+        out_wvf[k] = wvf
+        out_upper_band[k] = upper_band
+        out_is_high[k] = is_high
+
+
+def compute_vix_series(prices: np.ndarray,
+                       lookback: int,
+                       bb_length: int,
+                       bb_std: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized Williams VIX Fix over a whole price series, e.g. historical bars for a backtest.
+    Value ``j`` of the result is what ``calc_wvf_bb`` returns after ``lookback + j`` prices, when every earlier
+    VIX value was recorded in the VIX history.
+    :param prices: price series, oldest first
+    :param lookback: look back period for the highest close
+    :param bb_length: Bollinger Band length
+    :param bb_std: Bollinger Band standard deviation multiplier
+    :return: (wvf, is_high_volatility), both ``len(prices) - lookback + 1`` long (empty if there are fewer prices)
+    """
+    prices = np.asarray(prices, dtype=np.float64)
+    if prices.shape[0] < lookback:
+        return np.empty(0, dtype=np.float64), np.empty(0, dtype=np.bool_)
+    highest_close = sliding_window_view(prices, lookback).max(axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        wvf = np.where(highest_close == 0.0, 0.0, (highest_close - prices[lookback - 1:]) / highest_close * 100.0)
+
+    # The band of a value is taken over the bb_length values before it
+    is_high_volatility = np.zeros(wvf.shape[0], dtype=np.bool_)
+    if wvf.shape[0] > bb_length:
+        bb_windows = sliding_window_view(wvf[:-1], bb_length)
+        upper_band = bb_windows.mean(axis=1) + bb_std * bb_windows.std(axis=1)
+        is_high_volatility[bb_length:] = wvf[bb_length:] > upper_band
+    return wvf, is_high_volatility
+
+
+def warm_up():
+    """
+    Compiles (or loads from the Numba cache) the kernels ahead of the first tick.
+    This is a no-op cost when Numba is not installed.
+    """
+    buf = np.zeros(2, dtype=np.float64)
+    calc_wvf_bb(buf, 2, buf, 2, 2, 2, 2.0)
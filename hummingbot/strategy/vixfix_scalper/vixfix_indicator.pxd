@@ -0,0 +1,42 @@
+from libc.stdint cimport int64_t
+
+
+cdef class RollingMax:
+    cdef:
+        int64_t _window
+        int64_t _count
+        double[:] _values
+        int64_t[:] _indices
+        int64_t _head
+        int64_t _size
+
+    cdef double c_update(self, double value)
+
+
+cdef class RollingStats:
+    cdef:
+        int64_t _window
+        int64_t _count
+        double[:] _values
+        double _sum
+        double _sum_sq
+
+    cdef void c_update(self, double value)
+    cdef double c_mean(self)
+    cdef double c_std(self)
+
+
+cdef class VixFixIndicator:
+    cdef:
+        double _mult
+        double _ph
+        RollingMax _highest_close
+        RollingStats _wvf_stats
+        RollingMax _wvf_max
+        RollingStats _close_stats
+        readonly double wvf
+        readonly double upper_band
+        readonly double range_high
+        readonly double sma
+
+    cdef void c_update(self, double close)
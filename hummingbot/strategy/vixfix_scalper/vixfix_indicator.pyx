@@ -0,0 +1,162 @@
+from libc.math cimport NAN, isnan, sqrt
+from libc.stdint cimport int64_t
+
+import numpy as np
+
+
+cdef class RollingMax:
+    """Maximum of the last ``window`` values, updated in amortized O(1) with a monotonic deque."""
+
+    def __init__(self, int64_t window):
+        self._window = window
+        self._count = 0
+        # Circular deque of (index, value) candidates with decreasing values, the front is the maximum
+        self._values = np.empty(window, dtype=np.float64)
+        self._indices = np.empty(window, dtype=np.int64)
+        self._head = 0
+        self._size = 0
+
+    cdef double c_update(self, double value):
+        cdef int64_t position
+        while self._size > 0:
+            position = (self._head + self._size - 1) % self._window
+            if self._values[position] > value:
+                break
+            self._size -= 1
+        if self._size > 0 and self._indices[self._head] <= self._count - self._window:
+            self._head = (self._head + 1) % self._window
+            self._size -= 1
+        position = (self._head + self._size) % self._window
+        self._values[position] = value
+        self._indices[position] = self._count
+        self._size += 1
+        self._count += 1
+        if self._count < self._window:
+            return NAN
+        return self._values[self._head]
+
+    def update(self, double value) -> float:
+        """
+        Adds a value to the window.
+        :param value: the newest value
+        :return: the maximum of the window, NaN until ``window`` values were added
+        """
+        return self.c_update(value)
+
+
+cdef class RollingStats:
+    """Mean and sample standard deviation of the last ``window`` values, from running sums."""
+
+    def __init__(self, int64_t window):
+        self._window = window
+        self._count = 0
+        self._values = np.empty(window, dtype=np.float64)
+        self._sum = 0.0
+        self._sum_sq = 0.0
+
+    cdef void c_update(self, double value):
+        cdef:
+            int64_t position = self._count % self._window
+            double outgoing
+            int64_t i
+        if self._count >= self._window:
+            outgoing = self._values[position]
+            self._sum -= outgoing
+            self._sum_sq -= outgoing * outgoing
+        self._values[position] = value
+        self._count += 1
+        if self._count % self._window == 0:
+            # Resum once per window so rounding errors of the running sums cannot accumulate
+            self._sum = 0.0
+            self._sum_sq = 0.0
+            for i in range(self._window):
+                self._sum += self._values[i]
+                self._sum_sq += self._values[i] * self._values[i]
+        else:
+            self._sum += value
+            self._sum_sq += value * value
+
+    cdef double c_mean(self):
+        if self._count < self._window:
+            return NAN
+        return self._sum / self._window
+
+    cdef double c_std(self):
+        cdef:
+            int64_t n = self._window
+            double variance
+        if self._count < n or n < 2:
+            return NAN
+        variance = (self._sum_sq - self._sum * self._sum / n) / (n - 1)
+        return sqrt(variance) if variance > 0.0 else 0.0
+
+    def update(self, double value):
+        """
+        Adds a value to the window.
+        :param value: the newest value
+        """
+        self.c_update(value)
+
+    @property
+    def mean(self) -> float:
+        """Mean of the window, NaN until it is full"""
+        return self.c_mean()
+
+    @property
+    def std(self) -> float:
+        """Sample standard deviation (ddof=1, like pandas) of the window, NaN until it is full"""
+        return self.c_std()
+
+
+cdef class VixFixIndicator:
+    """
+    Williams VIX Fix of a close price series with its Bollinger Band, percentile range and an SMA of the closes.
+    Prices are added one at a time and every value is updated in O(1), the results equal the pandas rolling
+    calculations over the whole series. A value is NaN until its windows are full, so comparisons against it are
+    False, like comparisons against the NaN a pandas rolling window yields.
+    """
+
+    def __init__(self,
+                 int64_t pd=22,
+                 int64_t bbl=20,
+                 double mult=2.0,
+                 int64_t lb=50,
+                 double ph=0.85,
+                 int64_t sma_length=50):
+        """
+        :param pd: look back period of the highest close
+        :param bbl: Bollinger Band length
+        :param mult: Bollinger Band standard deviation multiplier
+        :param lb: look back period of the percentile high
+        :param ph: highest percentile
+        :param sma_length: length of the simple moving average of the closes
+        """
+        self._mult = mult
+        self._ph = ph
+        self._highest_close = RollingMax(pd)
+        self._wvf_stats = RollingStats(bbl)
+        self._wvf_max = RollingMax(lb)
+        self._close_stats = RollingStats(sma_length)
+        self.wvf = NAN
+        self.upper_band = NAN
+        self.range_high = NAN
+        self.sma = NAN
+
+    cdef void c_update(self, double close):
+        cdef double highest_close
+        self._close_stats.c_update(close)
+        self.sma = self._close_stats.c_mean()
+        highest_close = self._highest_close.c_update(close)
+        if isnan(highest_close):
+            return
+        self.wvf = (highest_close - close) / highest_close * 100
+        self._wvf_stats.c_update(self.wvf)
+        self.upper_band = self._wvf_stats.c_mean() + self._mult * self._wvf_stats.c_std()
+        self.range_high = self._wvf_max.c_update(self.wvf) * self._ph
+
+    def update(self, double close):
+        """
+        Adds the newest close and updates every indicator value.
+        :param close: the newest close price
+        """
+        self.c_update(close)
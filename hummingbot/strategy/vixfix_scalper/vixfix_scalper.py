@@ -1,17 +1,22 @@
 from decimal import Decimal
-from typing import Dict, List, Optional
+from typing import Tuple
 import numpy as np
-import pandas as pd
 import logging
-import asyncio
+import math
 
-from hummingbot.core.data_type.limit_order import LimitOrder
-from hummingbot.core.event.events import OrderType, OrderFilledEvent
 from hummingbot.strategy.strategy_py_base import StrategyPyBase
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
+from hummingbot.strategy.vixfix_scalper.vixfix_indicator import VixFixIndicator
+from hummingbot.strategy.vixfix_scalper.vixfix_series import compute_entry_signals
 from hummingbot.logger import HummingbotLogger
 
+s_decimal_zero = Decimal(0)
+s_decimal_one = Decimal(1)
 logger = None
+# Number of most recent prices kept
+PRICE_HISTORY_LENGTH = 100
+# Minimum number of seconds between stop loss adjustments
+STOP_LOSS_ADJUST_INTERVAL = 5.0
 
 class VixFixScalperStrategy(StrategyPyBase):
     @classmethod
@@ -33,6 +38,8 @@ class VixFixScalperStrategy(StrategyPyBase):
         self._base_order_amount = base_order_amount
         self._profit_target_pct = profit_target_pct
         self._initial_stop_loss_pct = initial_stop_loss_pct
+        # Entry price multiplier giving the profit target
+        self._profit_target_mul = s_decimal_one + profit_target_pct
         
         # VixFix Parameters
         self.pd = 22  # LookBack Period Standard Deviation High
@@ -41,6 +48,12 @@ class VixFixScalperStrategy(StrategyPyBase):
         self.lb = 50  # Look Back Period Percentile High
         self.ph = 0.85  # Highest Percentile
         self.pl = 1.01  # Lowest Percentile
+        self.sma_length = 50  # Price Confirmation SMA Length
+        # Updated with every price, so the entry check never recalculates whole windows
+        self._indicator = VixFixIndicator(self.pd, self.bbl, self.mult, self.lb, self.ph, self.sma_length)
+        # Prices needed before an entry is possible: the SMA, and the Bollinger Band (the earlier of the two VIX
+        # conditions) must both be available
+        self._min_entry_history = max(self.sma_length, self.pd + self.bbl - 1)
         
         # Paper Trading Settings
         self.paper_trade_enabled = True
@@ -50,24 +63,47 @@ class VixFixScalperStrategy(StrategyPyBase):
         # Dynamic Risk Management
         self.initial_portfolio_value = Decimal("10000")  # Starting paper trading capital
         self.current_portfolio_value = self.initial_portfolio_value
+        # Float copy of current_portfolio_value for the stop loss calculation, update both together
+        self._current_portfolio_value_f = float(self.current_portfolio_value)
         self.consecutive_wins = 0
         self.base_risk_amount = Decimal("150")  # Initial risk amount $150
         self.max_risk_amount = Decimal("300")   # Maximum risk amount $300
+        # Risk amount per number of consecutive wins, it grows by 25% of the base per win up to the maximum, so the
+        # last entry applies to any longer streak
+        base_risk = float(self.base_risk_amount)
+        max_risk = float(self.max_risk_amount)
+        # Wins until the maximum is reached, a base that is not positive never grows towards it
+        max_wins = math.ceil((max_risk / base_risk - 1.0) / 0.25) if 0.0 < base_risk < max_risk else 0
+        self._risk_table = [min(base_risk * (1.0 + 0.25 * wins), max_risk) for wins in range(max_wins + 1)]
         
         # PnL Tracking
-        self.total_realized_pnl = Decimal("0")
-        self.current_unrealized_pnl = Decimal("0")
+        self.total_realized_pnl = s_decimal_zero
+        self.current_unrealized_pnl = s_decimal_zero
         self.total_trades = 0
         self.winning_trades = 0
         self.losing_trades = 0
         
         # Trading state
         self.in_position = False
-        self.entry_price = Decimal("0")
-        self.profit_target_price = Decimal("0")
-        self.stop_loss_price = Decimal("0")
-        self._last_stop_loss = Decimal("0")
-        self.price_history = []
+        self.entry_price = s_decimal_zero
+        self.profit_target_price = s_decimal_zero
+        self.stop_loss_price = s_decimal_zero
+        # Last logged stop loss price
+        self._last_stop_loss_f = 0.0
+        # Float copies of the entry and exit prices, the exits are compared against the float mid price every tick.
+        # The exit prices are calculated in Decimal and then converted, so an exit fires at the same prices as a
+        # Decimal comparison would
+        self._entry_price_f = 0.0
+        self._profit_target_price_f = 0.0
+        self._stop_loss_price_f = 0.0
+        # Stop loss percentage the stop loss price was set from
+        self._stop_loss_pct = 0.0
+        # Mid price of the current tick
+        self._current_price = s_decimal_zero
+        self._current_price_f = 0.0
+        # Ring buffer of the latest prices, price number i (0 based) is stored at i % PRICE_HISTORY_LENGTH
+        self._price_buf = np.empty(PRICE_HISTORY_LENGTH, dtype=np.float64)
+        self._price_count = 0
         self.last_volatility_check = 0
         self._last_timestamp = 0
         self._ready_to_trade = False
@@ -75,6 +111,24 @@ class VixFixScalperStrategy(StrategyPyBase):
         
         self.add_markets([market_info.market])
 
+    @property
+    def price_history(self) -> np.ndarray:
+        """The latest prices, oldest first"""
+        count = min(self._price_count, PRICE_HISTORY_LENGTH)
+        head = self._price_count % PRICE_HISTORY_LENGTH
+        if count < PRICE_HISTORY_LENGTH:
+            return self._price_buf[:count].copy()
+        return np.concatenate((self._price_buf[head:], self._price_buf[:head]))
+
+    def compute_signals(self, closes: np.ndarray) -> np.ndarray:
+        """
+        Entry signals of this strategy's indicator settings over a whole close price series, e.g. for tuning the
+        parameters on historical data without replaying it tick by tick
+        :param closes: close price series, oldest first
+        :return: boolean array, True where should_enter_long would be True after that close
+        """
+        return compute_entry_signals(closes, self.pd, self.bbl, self.mult, self.lb, self.ph, self.sma_length)
+
     def tick(self, timestamp: float):
         try:
             if timestamp - self._last_timestamp <= 1.0:
@@ -83,194 +137,166 @@ class VixFixScalperStrategy(StrategyPyBase):
             
             if not self._ready_to_trade:
                 if not self._market_info.market.ready:
-                    self.logger().info(f"Waiting for {self._market_info.market.name} to be ready...")
+                    self.logger().info("Waiting for %s to be ready...", self._market_info.market.name)
                     return
                 self._ready_to_trade = True
-                self.logger().info(f"Paper trading started on {self._market_info.market.name} for {self.trading_pair}")
+                self.logger().info("Paper trading started on %s for %s", self._market_info.market.name, self.trading_pair)
             
-            # Safely get current price
-            try:
-                current_price = self._market_info.get_mid_price()
-                if current_price is None or current_price == Decimal("0"):
-                    self.logger().warning("Unable to get current price. Skipping tick.")
-                    return
-                    
-                self.price_history.append(float(current_price))
-                if len(self.price_history) > 100:
-                    self.price_history = self.price_history[-100:]
-                    
-                # Log price updates every 30 seconds
+            current_price = self._market_info.get_mid_price()
+            if current_price is None or current_price == s_decimal_zero:
+                self.logger().warning("Unable to get current price. Skipping tick.")
+                return
+
+            price = float(current_price)
+            self._current_price = current_price
+            self._current_price_f = price
+            self._price_buf[self._price_count % PRICE_HISTORY_LENGTH] = price
+            self._price_count += 1
+            self._indicator.update(price)
+
+            # Log price updates every 30 seconds
+            if timestamp - self._last_price_log >= 30:
+                self._last_price_log = timestamp
+                self.logger().info("Current %s price: %s", self.trading_pair, current_price)
+
+            # Only proceed if we have enough price history
+            if self._price_count < self.pd:
                 if timestamp - self._last_price_log >= 30:
-                    self._last_price_log = timestamp
-                    self.logger().info(f"Current {self.trading_pair} price: {current_price}")
-                
-                # Only proceed if we have enough price history
-                if len(self.price_history) >= self.pd:
-                    if not self.in_position:
-                        if self.should_enter_long():
-                            self.enter_long()
-                    else:
-                        self.adjust_stop_loss()
-                        self.check_exit_conditions()
-                else:
-                    if timestamp - self._last_price_log >= 30:
-                        self.logger().info(f"Building price history: {len(self.price_history)}/{self.pd}")
-                    
-            except Exception as price_error:
-                self.logger().error(f"Error processing price data: {str(price_error)}", exc_info=True)
-                
+                    self.logger().info("Building price history: %d/%d", self._price_count, self.pd)
+                return
+
+            if not self.in_position:
+                if self.should_enter_long():
+                    self.enter_long()
+                return
+
+            if timestamp - self.last_volatility_check >= STOP_LOSS_ADJUST_INTERVAL:
+                self.last_volatility_check = timestamp
+                self.adjust_stop_loss()
+            self.check_exit_conditions()
         except Exception as e:
-            self.logger().error(f"Error in tick: {str(e)}", exc_info=True)
+            self.logger().error("Error in tick: %s", e, exc_info=True)
 
     def should_enter_long(self) -> bool:
-        try:
-            if len(self.price_history) < self.pd:
-                return False
-                
-            # Convert price history to DataFrame
-            df = pd.DataFrame(self.price_history, columns=['close'])
-            df['high'] = df['close']
-            df['low'] = df['close']
-            
-            # Calculate Williams Vix Fix
-            highest_close = df['close'].rolling(window=self.pd).max()
-            wvf = ((highest_close - df['low']) / highest_close) * 100
-            
-            # Calculate Bollinger Bands on WVF
-            mid_line = wvf.rolling(window=self.bbl).mean()
-            bb_std = wvf.rolling(window=self.bbl).std()
-            upper_band = mid_line + (self.mult * bb_std)
-            
-            # Calculate percentile range
-            range_high = wvf.rolling(window=self.lb).max() * self.ph
-            
-            # Get current values
-            current_wvf = wvf.iloc[-1]
-            current_upper_band = upper_band.iloc[-1]
-            current_range_high = range_high.iloc[-1]
-            
-            # Entry conditions
-            vix_signal = current_wvf >= current_upper_band or current_wvf >= current_range_high
-            
-            # Price confirmation using SMA
-            sma_50 = df['close'].rolling(window=50).mean().iloc[-1]
-            current_price = self._market_info.get_mid_price()
-            price_above_sma = float(current_price) > float(sma_50)
-            
-            if vix_signal and price_above_sma:
-                self.logger().info(f"Entry signal detected - VIX: {current_wvf:.2f}, Upper Band: {current_upper_band:.2f}")
-            
-            return vix_signal and price_above_sma
-            
-        except Exception as e:
-            self.logger().error(f"Error in should_enter_long: {str(e)}", exc_info=True)
+        if self._price_count < self._min_entry_history:
+            return False
+
+        indicator = self._indicator
+
+        # Price confirmation using SMA, checked first as it is the cheaper condition
+        if not self._current_price_f > indicator.sma:
             return False
 
+        # Entry conditions
+        current_wvf = indicator.wvf
+        current_upper_band = indicator.upper_band
+        vix_signal = current_wvf >= current_upper_band or current_wvf >= indicator.range_high
+
+        if vix_signal:
+            self.logger().info("Entry signal detected - VIX: %.2f, Upper Band: %.2f", current_wvf, current_upper_band)
+
+        return vix_signal
+
+    def _risk(self) -> Tuple[float, float]:
+        """
+        Dynamic risk based on consecutive wins
+        Returns: (risk_amount, stop_loss_pct), the stop loss percentage as a fraction
+        """
+        risk_amount = self._risk_table[min(self.consecutive_wins, len(self._risk_table) - 1)]
+        return risk_amount, risk_amount / self._current_portfolio_value_f
+
     def adjust_stop_loss(self):
-        try:
-            if not self.in_position:
-                return
-                
-            current_price = float(self._market_info.get_mid_price())
-            
-            # Calculate dynamic risk based on consecutive wins
-            risk_amount = min(
-                self.base_risk_amount * (Decimal("1") + Decimal("0.25") * self.consecutive_wins),
-                self.max_risk_amount
-            )
-            
-            # Calculate stop loss percentage (as a decimal)
-            stop_loss_pct = float(risk_amount) / float(self.current_portfolio_value)
-            
-            # Update stop loss price
-            self.stop_loss_price = self.entry_price * (Decimal("1") - Decimal(str(stop_loss_pct)))
-            
-            # Only log if stop loss has changed significantly
-            if abs(float(self.stop_loss_price) - float(self._last_stop_loss)) > 0.01:
-                self._last_stop_loss = self.stop_loss_price
-                self.logger().info(f"Paper trade - Adjusted stop loss to: {self.stop_loss_price:.2f} ({stop_loss_pct*100:.2f}%)")
-                
-        except Exception as e:
-            self.logger().error(f"Error adjusting stop loss: {str(e)}", exc_info=True)
+        if not self.in_position:
+            return
+
+        risk_amount, stop_loss_pct = self._risk()
+
+        # The stop loss only moves when the risk changes
+        if stop_loss_pct == self._stop_loss_pct:
+            return
+        self._set_stop_loss(stop_loss_pct)
+
+        # Only log if stop loss has changed significantly
+        if abs(self._stop_loss_price_f - self._last_stop_loss_f) > 0.01:
+            self._last_stop_loss_f = self._stop_loss_price_f
+            self.logger().info("Paper trade - Adjusted stop loss to: %.2f (%.2f%%)",
+                               self._stop_loss_price_f, stop_loss_pct * 100)
+
+    def _set_stop_loss(self, stop_loss_pct: float):
+        """Sets the stop loss price of the position, stop_loss_pct is a fraction of the entry price"""
+        self._stop_loss_pct = stop_loss_pct
+        self.stop_loss_price = self.entry_price * (s_decimal_one - Decimal(str(stop_loss_pct)))
+        self._stop_loss_price_f = float(self.stop_loss_price)
 
     def enter_long(self):
         try:
-            current_price = self._market_info.get_mid_price()
-            
-            # Calculate dynamic risk based on consecutive wins
-            risk_amount = min(
-                self.base_risk_amount * (Decimal("1") + Decimal("0.25") * self.consecutive_wins),
-                self.max_risk_amount
-            )
-            
-            # Calculate stop loss percentage based on risk amount
-            stop_loss_pct = float(risk_amount) / float(self.current_portfolio_value)
-            
+            current_price = self._current_price
+            risk_amount, stop_loss_pct = self._risk()
+
             # Use existing order amount
             order_amount = self._base_order_amount
-            
+
             # Paper trade - simulate buy order
             self.in_position = True
             self.entry_price = current_price
-            self.profit_target_price = current_price * (Decimal("1") + self._profit_target_pct)
-            self.stop_loss_price = current_price * (Decimal("1") - Decimal(str(stop_loss_pct)))
-            self._last_stop_loss = self.stop_loss_price
-            
-            self.logger().info(
-                f"Paper trade - Entered long: {self.trading_pair}\n"
-                f"Price: ${float(current_price):.2f}\n"
-                f"Amount: {float(order_amount):.6f}\n"
-                f"Target: ${float(self.profit_target_price):.2f}\n"
-                f"Stop: ${float(self.stop_loss_price):.2f}\n"
-                f"Risk: ${float(risk_amount):.2f}"
-            )
+            self._entry_price_f = self._current_price_f
+            self.profit_target_price = current_price * self._profit_target_mul
+            self._profit_target_price_f = float(self.profit_target_price)
+            self._set_stop_loss(stop_loss_pct)
+            self._last_stop_loss_f = self._stop_loss_price_f
+
+            if self.logger().isEnabledFor(logging.INFO):
+                self.logger().info(
+                    "Paper trade - Entered long: %s\nPrice: $%.2f\nAmount: %.6f\nTarget: $%.2f\nStop: $%.2f\nRisk: $%.2f",
+                    self.trading_pair, self._entry_price_f, float(order_amount), self._profit_target_price_f,
+                    self._stop_loss_price_f, risk_amount
+                )
         except Exception as e:
-            self.logger().error(f"Error entering long position: {str(e)}", exc_info=True)
+            self.logger().error("Error entering long position: %s", e, exc_info=True)
 
     def check_exit_conditions(self):
         try:
             if not self.in_position:
                 return
 
-            current_price = self._market_info.get_mid_price()
-            
+            current_price = self._current_price_f
+
             # Check stop loss
-            if current_price <= self.stop_loss_price:
+            if current_price <= self._stop_loss_price_f:
                 self.exit_position("Stop loss hit")
                 self.consecutive_wins = 0
                 self.losing_trades += 1
                 
             # Check profit target
-            elif current_price >= self.profit_target_price:
+            elif current_price >= self._profit_target_price_f:
                 self.exit_position("Profit target reached")
                 self.consecutive_wins += 1
                 self.winning_trades += 1
         except Exception as e:
-            self.logger().error(f"Error checking exit conditions: {str(e)}", exc_info=True)
+            self.logger().error("Error checking exit conditions: %s", e, exc_info=True)
 
     def exit_position(self, reason: str):
         try:
             if not self.in_position:
                 return
-                
-            current_price = self._market_info.get_mid_price()
-            
+
+            current_price = self._current_price
+
             # Paper trade - simulate sell order
             self.in_position = False
             pnl = (current_price - self.entry_price) * self._base_order_amount
             self.total_realized_pnl += pnl
             self.total_trades += 1
             
-            self.logger().info(
-                f"Paper trade - Exited position: {self.trading_pair}\n"
-                f"Reason: {reason}\n"
-                f"Exit Price: ${float(current_price):.2f}\n"
-                f"PnL: ${float(pnl):.2f}\n"
-                f"Total PnL: ${float(self.total_realized_pnl):.2f}\n"
-                f"Win Rate: {self.winning_trades/self.total_trades*100:.1f}%"
-            )
+            if self.logger().isEnabledFor(logging.INFO):
+                self.logger().info(
+                    "Paper trade - Exited position: %s\nReason: %s\nExit Price: $%.2f\nPnL: $%.2f\nTotal PnL: $%.2f\n"
+                    "Win Rate: %.1f%%",
+                    self.trading_pair, reason, self._current_price_f, float(pnl), float(self.total_realized_pnl),
+                    self.winning_trades / self.total_trades * 100
+                )
         except Exception as e:
-            self.logger().error(f"Error exiting position: {str(e)}", exc_info=True)
+            self.logger().error("Error exiting position: %s", e, exc_info=True)
 
     def format_status(self) -> str:
         if not self._ready_to_trade:
@@ -282,10 +308,10 @@ class VixFixScalperStrategy(StrategyPyBase):
         lines.append(f"  Ready to trade: {self._ready_to_trade}")
         lines.append(f"  Current position: {'In position' if self.in_position else 'No position'}")
         
-        if len(self.price_history) > 0:
-            current_price = self.price_history[-1]
+        if self._price_count > 0:
+            current_price = self._price_buf[(self._price_count - 1) % PRICE_HISTORY_LENGTH]
             lines.append(f"  Current price: ${current_price:.2f}")
-            lines.append(f"  Price history length: {len(self.price_history)}/{self.pd}")
+            lines.append(f"  Price history length: {min(self._price_count, PRICE_HISTORY_LENGTH)}/{self.pd}")
         
         if self.in_position:
             lines.append(f"\nCurrent Trade:")
@@ -10,6 +10,7 @@ from hummingbot.client.config.config_validators import (
 )
 from hummingbot.client.settings import AllConnectorSettings
 
+
 def trading_pair_prompt():
     exchange = vixfix_scalper_config_map.get("connector").value
     example = AllConnectorSettings.get_example_pairs().get(exchange)
@@ -18,10 +19,12 @@ def trading_pair_prompt():
         f" (e.g. {example})" if example else "",
     )
 
+
 def validate_trading_pair(value: str) -> Optional[str]:
     exchange = vixfix_scalper_config_map.get("connector").value
     return validate_market_trading_pair(exchange, value)
 
+
 vixfix_scalper_config_map = {
     "strategy": ConfigVar(
         key="strategy",
@@ -0,0 +1,186 @@
+import math
+from typing import Tuple
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from hummingbot.core.utils.jit import NUMBA_AVAILABLE, njit
+
+
+@njit(cache=True)
+def _vixfix_kernel(prices: np.ndarray,
+                   pd: int,
+                   bbl: int,
+                   mult: float,
+                   lb: int,
+                   ph: float,
+                   sma_length: int,
+                   wvf: np.ndarray,
+                   upper_band: np.ndarray,
+                   range_high: np.ndarray,
+                   sma: np.ndarray):
+    """
+    Fills the VixFix series in a single pass over the prices, see ``compute_vixfix_series``. Only fast when compiled
+    by Numba, which is not installed by default, ``_vixfix_windows`` is used otherwise.
+    The rolling maximums are kept in monotonic deques and the means and standard deviation in running sums, which
+    are resummed once per window so rounding errors cannot accumulate over long series.
+    The output arrays must be as long as ``prices`` and already hold NaN.
+    """
+    n = prices.shape[0]
+    # Deques of indices with decreasing values, from the head (the maximum) to the tail
+    close_deque = np.empty(n, dtype=np.int64)
+    close_head = 0
+    close_tail = 0
+    wvf_deque = np.empty(n, dtype=np.int64)
+    wvf_head = 0
+    wvf_tail = 0
+    close_sum = 0.0
+    wvf_sum = 0.0
+    wvf_sum_sq = 0.0
+
+    for i in range(n):
+        close = prices[i]
+
+        if i >= sma_length:
+            close_sum -= prices[i - sma_length]
+        if (i + 1) % sma_length == 0:
+            close_sum = 0.0
+            for k in range(i + 1 - sma_length, i + 1):
+                close_sum += prices[k]
+        else:
+            close_sum += close
+        if i >= sma_length - 1:
+            sma[i] = close_sum / sma_length
+
+        while close_tail > close_head and prices[close_deque[close_tail - 1]] <= close:
+            close_tail -= 1
+        close_deque[close_tail] = i
+        close_tail += 1
+        if close_deque[close_head] <= i - pd:
+            close_head += 1
+        if i < pd - 1:
+            continue
+
+        highest_close = prices[close_deque[close_head]]
+        value = (highest_close - close) / highest_close * 100
+        wvf[i] = value
+        # Number of WVF values before this one
+        j = i - pd + 1
+
+        if j >= bbl:
+            outgoing = wvf[i - bbl]
+            wvf_sum -= outgoing
+            wvf_sum_sq -= outgoing * outgoing
+        if (j + 1) % bbl == 0:
+            wvf_sum = 0.0
+            wvf_sum_sq = 0.0
+            for k in range(i + 1 - bbl, i + 1):
+                wvf_sum += wvf[k]
+                wvf_sum_sq += wvf[k] * wvf[k]
+        else:
+            wvf_sum += value
+            wvf_sum_sq += value * value
+        if j >= bbl - 1 and bbl > 1:
+            variance = (wvf_sum_sq - wvf_sum * wvf_sum / bbl) / (bbl - 1)
+            upper_band[i] = wvf_sum / bbl + mult * (math.sqrt(variance) if variance > 0.0 else 0.0)
+
+        while wvf_tail > wvf_head and wvf[wvf_deque[wvf_tail - 1]] <= value:
+            wvf_tail -= 1
+        wvf_deque[wvf_tail] = i
+        wvf_tail += 1
+        if wvf_deque[wvf_head] <= i - lb:
+            wvf_head += 1
+        if j >= lb - 1:
+            range_high[i] = wvf[wvf_deque[wvf_head]] * ph
+
+
+def _vixfix_windows(prices: np.ndarray,
+                    pd: int,
+                    bbl: int,
+                    mult: float,
+                    lb: int,
+                    ph: float,
+                    sma_length: int,
+                    wvf: np.ndarray,
+                    upper_band: np.ndarray,
+                    range_high: np.ndarray,
+                    sma: np.ndarray):
+    """
+    Fills the VixFix series with vectorized NumPy window operations, see ``compute_vixfix_series``.
+    Used when Numba is not installed, where the loop of ``_vixfix_kernel`` would run in the interpreter.
+    The output arrays must be as long as ``prices`` and already hold NaN.
+    """
+    n = prices.shape[0]
+    # Rolling sums are convolutions with a window of ones, each sum adds up only its own window so unlike
+    # differences of cumulative sums no rounding error builds up along the series
+    if n >= sma_length:
+        sma[sma_length - 1:] = np.convolve(prices, np.ones(sma_length), "valid") / sma_length
+    if n < pd:
+        return
+
+    highest_close = sliding_window_view(prices, pd).max(axis=1)
+    wvf[pd - 1:] = (highest_close - prices[pd - 1:]) / highest_close * 100
+    # WVF values, starting with the first one that exists
+    defined_wvf = wvf[pd - 1:]
+    if defined_wvf.shape[0] >= bbl and bbl > 1:
+        ones = np.ones(bbl)
+        wvf_sums = np.convolve(defined_wvf, ones, "valid")
+        variance = (np.convolve(defined_wvf * defined_wvf, ones, "valid") - wvf_sums * wvf_sums / bbl) / (bbl - 1)
+        upper_band[pd + bbl - 2:] = wvf_sums / bbl + mult * np.sqrt(np.maximum(variance, 0.0))
+    if defined_wvf.shape[0] >= lb:
+        range_high[pd + lb - 2:] = sliding_window_view(defined_wvf, lb).max(axis=1) * ph
+
+
+def compute_vixfix_series(prices: np.ndarray,
+                          pd: int = 22,
+                          bbl: int = 20,
+                          mult: float = 2.0,
+                          lb: int = 50,
+                          ph: float = 0.85,
+                          sma_length: int = 50) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    VixFix indicators over a whole close price series, e.g. historical bars for a backtest.
+    Value ``i`` of each result is what ``VixFixIndicator`` holds after the first ``i + 1`` prices, NaN until the
+    windows it depends on are full. With Numba installed (opt-in) all four series are computed in one compiled pass,
+    otherwise with vectorized window reductions.
+    :param prices: close price series, oldest first
+    :param pd: look back period of the highest close
+    :param bbl: Bollinger Band length
+    :param mult: Bollinger Band standard deviation multiplier
+    :param lb: look back period of the percentile high
+    :param ph: highest percentile
+    :param sma_length: length of the simple moving average of the closes
+    :return: (wvf, upper_band, range_high, sma), each as long as ``prices``
+    """
+    prices = np.ascontiguousarray(prices, dtype=np.float64)
+    n = prices.shape[0]
+    wvf = np.full(n, np.nan)
+    upper_band = np.full(n, np.nan)
+    range_high = np.full(n, np.nan)
+    sma = np.full(n, np.nan)
+    fill = _vixfix_kernel if NUMBA_AVAILABLE else _vixfix_windows
+    fill(prices, pd, bbl, mult, lb, ph, sma_length, wvf, upper_band, range_high, sma)
+    return wvf, upper_band, range_high, sma
+
+
+def compute_entry_signals(prices: np.ndarray,
+                          pd: int = 22,
+                          bbl: int = 20,
+                          mult: float = 2.0,
+                          lb: int = 50,
+                          ph: float = 0.85,
+                          sma_length: int = 50) -> np.ndarray:
+    """
+    Long entry signals over a whole close price series, for replaying the strategy on historical bars.
+    Value ``i`` is True when the price is above its SMA and the WVF reaches its upper band or percentile high after
+    the first ``i + 1`` prices, i.e. the condition ``VixFixScalperStrategy.should_enter_long`` checks.
+    :param prices: close price series, oldest first
+    :return: boolean signal per price, False while the windows the signal depends on are not full
+    """
+    prices = np.ascontiguousarray(prices, dtype=np.float64)
+    wvf, upper_band, range_high, sma = compute_vixfix_series(prices, pd, bbl, mult, lb, ph, sma_length)
+    # Comparisons against NaN are False, so a condition never holds before its windows are full
+    signals = (prices > sma) & ((wvf >= upper_band) | (wvf >= range_high))
+    # Like the strategy, wait for the SMA and the Bollinger Band, even when the percentile high is ready earlier
+    signals[:max(sma_length, pd + bbl - 1) - 1] = False
+    return signals
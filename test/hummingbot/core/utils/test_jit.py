@@ -0,0 +1,23 @@
+from unittest import TestCase
+
+from hummingbot.core.utils.jit import njit, prange
+
+
+class JitTest(TestCase):
+
+    def test_njit_without_arguments(self):
+        @njit
+        def add(a, b):
+            return a + b
+
+        self.assertEqual(3, add(1, 2))
+
+    def test_njit_with_arguments(self):
+        @njit(cache=True, fastmath=True)
+        def total(n):
+            result = 0
+            for i in prange(n):
+                result += i
+            return result
+
+        self.assertEqual(45, total(10))
@@ -0,0 +1,70 @@
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+
+from hummingbot.strategy.cm_williams_vix_maker.vix_history import VixHistory
+from hummingbot.strategy.cm_williams_vix_maker.vix_kernel import calc_wvf_bb, compute_vix_series
+
+KERNEL = "hummingbot.strategy.cm_williams_vix_maker.vix_history.calc_wvf_bb"
+
+
+class VixHistoryTest(unittest.TestCase):
+    LOOKBACK = 22
+    BB_LENGTH = 20
+    BB_STD = 2.0
+
+    def setUp(self) -> None:
+        rng = np.random.default_rng(3)
+        returns = rng.normal(0, 0.002, 300)
+        # Sharp drops so that some prices are high volatility
+        returns[::37] -= 0.03
+        self.prices = 100 * np.cumprod(1 + returns)
+        self.history = VixHistory(self.LOOKBACK, self.BB_LENGTH, self.BB_STD)
+
+    def test_no_reading_before_warm_up(self):
+        with patch(KERNEL, wraps=calc_wvf_bb) as kernel:
+            for price in self.prices[:self.LOOKBACK - 1]:
+                self.history.append_price(price)
+                self.assertEqual((0.0, False), self.history.calculate())
+                self.history.commit()
+        kernel.assert_not_called()
+        self.assertEqual(0, self.history.vix_count)
+
+    def test_vix_calculated_once_per_price(self):
+        with patch(KERNEL, wraps=calc_wvf_bb) as kernel:
+            for i, price in enumerate(self.prices, 1):
+                calls = kernel.call_count
+                self.history.append_price(price)
+                reading = self.history.calculate()
+                self.assertEqual(reading, self.history.calculate())
+                self.history.commit()
+                self.history.commit()
+                self.assertEqual(1 if i >= self.LOOKBACK else 0, kernel.call_count - calls)
+        self.assertEqual(len(self.prices), self.history.price_count)
+        self.assertEqual(len(self.prices) - self.LOOKBACK + 1, self.history.vix_count)
+
+    def test_readings_match_vix_series(self):
+        readings = []
+        for price in self.prices:
+            self.history.append_price(price)
+            readings.append(self.history.calculate())
+            self.history.commit()
+
+        wvf, is_high = compute_vix_series(self.prices, self.LOOKBACK, self.BB_LENGTH, self.BB_STD)
+        np.testing.assert_allclose(wvf, [vix for vix, _ in readings[self.LOOKBACK - 1:]])
+        self.assertEqual(list(is_high), [high for _, high in readings[self.LOOKBACK - 1:]])
+        self.assertTrue(any(is_high))
+
+    def test_reading_kept_after_commit(self):
+        with patch(KERNEL, wraps=calc_wvf_bb) as kernel:
+            for price in self.prices:
+                self.history.append_price(price)
+                proposal_reading = self.history.calculate()
+                self.history.commit()
+                calls = kernel.call_count
+                # What the cancel check of the next tick reads before that tick's price is recorded
+                self.assertEqual(proposal_reading, self.history.calculate())
+                self.assertEqual(calls, kernel.call_count)
+        # The committed VIX is the reading the proposals used
+        self.assertEqual(proposal_reading[0], self.history._vix_buf[(self.history.vix_count - 1) % self.BB_LENGTH])
@@ -0,0 +1,141 @@
+import unittest
+
+import numpy as np
+
+from hummingbot.core.utils.jit import NUMBA_AVAILABLE
+from hummingbot.strategy.cm_williams_vix_maker.vix_kernel import calc_wvf_bb, calc_wvf_bb_batch, compute_vix_series
+
+
+class VixKernelTest(unittest.TestCase):
+    LOOKBACK = 22
+    BB_LENGTH = 20
+    BB_STD = 2.0
+
+    def setUp(self) -> None:
+        rng = np.random.default_rng(42)
+        self.prices = 100 + np.cumsum(rng.normal(0, 1, 60))
+        self.vix = rng.uniform(0, 5, 30)
+
+    @staticmethod
+    def ring_buffer(values: np.ndarray, length: int) -> np.ndarray:
+        buf = np.empty(length, dtype=np.float64)
+        for i, value in enumerate(values):
+            buf[i % length] = value
+        return buf
+
+    def calculate(self, prices: np.ndarray, vix: np.ndarray):
+        return calc_wvf_bb(
+            self.ring_buffer(prices, self.LOOKBACK), len(prices),
+            self.ring_buffer(vix, self.BB_LENGTH), len(vix),
+            self.LOOKBACK, self.BB_LENGTH, self.BB_STD,
+        )
+
+    def test_wvf_matches_numpy_reference(self):
+        wvf, _, _ = self.calculate(self.prices, self.vix)
+
+        highest_close = np.max(self.prices[-self.LOOKBACK:])
+        expected = (highest_close - self.prices[-1]) / highest_close * 100
+        self.assertAlmostEqual(expected, wvf)
+
+    def test_upper_band_matches_numpy_reference(self):
+        wvf, upper_band, is_high = self.calculate(self.prices, self.vix)
+
+        window = self.vix[-self.BB_LENGTH:]
+        expected = np.mean(window) + self.BB_STD * np.std(window)
+        self.assertAlmostEqual(expected, upper_band)
+        self.assertEqual(wvf > expected, is_high)
+
+    def test_buffers_longer_than_windows(self):
+        wvf, upper_band, _ = calc_wvf_bb(
+            self.ring_buffer(self.prices, 2 * self.LOOKBACK), len(self.prices),
+            self.ring_buffer(self.vix, 2 * self.BB_LENGTH), len(self.vix),
+            self.LOOKBACK, self.BB_LENGTH, self.BB_STD,
+        )
+        expected_wvf, expected_upper_band, _ = self.calculate(self.prices, self.vix)
+
+        self.assertAlmostEqual(expected_wvf, wvf)
+        self.assertAlmostEqual(expected_upper_band, upper_band)
+
+    def test_high_volatility_signal(self):
+        prices = np.array([100.0] * (self.LOOKBACK - 1) + [80.0])
+        vix = np.zeros(self.BB_LENGTH)
+
+        wvf, upper_band, is_high = self.calculate(prices, vix)
+
+        self.assertAlmostEqual(20.0, wvf)
+        self.assertEqual(0.0, upper_band)
+        self.assertTrue(is_high)
+
+    def test_no_signal_without_enough_vix_history(self):
+        wvf, upper_band, is_high = self.calculate(self.prices, self.vix[:self.BB_LENGTH - 1])
+
+        self.assertGreaterEqual(wvf, 0.0)
+        self.assertEqual(0.0, upper_band)
+        self.assertFalse(is_high)
+
+    def test_vix_series_matches_incremental_calculation(self):
+        wvf_series, is_high_series = compute_vix_series(self.prices, self.LOOKBACK, self.BB_LENGTH, self.BB_STD)
+
+        self.assertEqual(len(self.prices) - self.LOOKBACK + 1, len(wvf_series))
+        vix = []
+        for j, count in enumerate(range(self.LOOKBACK, len(self.prices) + 1)):
+            wvf, _, is_high = self.calculate(self.prices[:count], np.array(vix))
+            self.assertAlmostEqual(wvf, wvf_series[j])
+            self.assertEqual(is_high, is_high_series[j])
+            vix.append(wvf)
+
+    def test_vix_series_shorter_than_lookback(self):
+        wvf, is_high = compute_vix_series(self.prices[:self.LOOKBACK - 1], self.LOOKBACK, self.BB_LENGTH, self.BB_STD)
+
+        self.assertEqual(0, len(wvf))
+        self.assertEqual(0, len(is_high))
+
+    def test_batch_matches_single_pair_calculation(self):
+        pairs = [(self.prices, self.vix), (self.prices[:40], self.vix[:10]), (self.prices[::-1], self.vix[::-1])]
+        price_bufs = np.stack([self.ring_buffer(prices, self.LOOKBACK) for prices, _ in pairs])
+        vix_bufs = np.stack([self.ring_buffer(vix, self.BB_LENGTH) for _, vix in pairs])
+        price_counts = np.array([len(prices) for prices, _ in pairs], dtype=np.int64)
+        vix_counts = np.array([len(vix) for _, vix in pairs], dtype=np.int64)
+        wvf = np.empty(len(pairs))
+        upper_band = np.empty(len(pairs))
+        is_high = np.empty(len(pairs), dtype=np.bool_)
+
+        calc_wvf_bb_batch(price_bufs, price_counts, vix_bufs, vix_counts,
+                          self.LOOKBACK, self.BB_LENGTH, self.BB_STD, wvf, upper_band, is_high)
+
+        for k, (prices, vix) in enumerate(pairs):
+            expected_wvf, expected_upper_band, expected_is_high = self.calculate(prices, vix)
+            self.assertAlmostEqual(expected_wvf, wvf[k])
+            self.assertAlmostEqual(expected_upper_band, upper_band[k])
+            self.assertEqual(expected_is_high, is_high[k])
+
+    @unittest.skipUnless(NUMBA_AVAILABLE, "Numba is not installed")
+    def test_compiled_kernel_matches_python(self):
+        price_buf = self.ring_buffer(self.prices, self.LOOKBACK)
+        vix_buf = self.ring_buffer(self.vix, self.BB_LENGTH)
+        args = (price_buf, len(self.prices), vix_buf, len(self.vix), self.LOOKBACK, self.BB_LENGTH, self.BB_STD)
+
+        wvf, upper_band, is_high = calc_wvf_bb(*args)
+        expected_wvf, expected_upper_band, expected_is_high = calc_wvf_bb.py_func(*args)
+
+        self.assertTrue(calc_wvf_bb.signatures)
+        self.assertAlmostEqual(expected_wvf, wvf)
+        self.assertAlmostEqual(expected_upper_band, upper_band)
+        self.assertEqual(expected_is_high, is_high)
+
+    @unittest.skipUnless(NUMBA_AVAILABLE, "Numba is not installed")
+    def test_compiled_batch_matches_python(self):
+        price_bufs = np.stack([self.ring_buffer(self.prices[i:], self.LOOKBACK) for i in range(8)])
+        vix_bufs = np.stack([self.ring_buffer(self.vix[i:], self.BB_LENGTH) for i in range(8)])
+        price_counts = np.array([len(self.prices) - i for i in range(8)], dtype=np.int64)
+        vix_counts = np.array([len(self.vix) - i for i in range(8)], dtype=np.int64)
+        results = []
+        for batch in (calc_wvf_bb_batch, calc_wvf_bb_batch.py_func):
+            outputs = (np.empty(8), np.empty(8), np.empty(8, dtype=np.bool_))
+            batch(price_bufs, price_counts, vix_bufs, vix_counts, self.LOOKBACK, self.BB_LENGTH, self.BB_STD,
+                  *outputs)
+            results.append(outputs)
+
+        self.assertTrue(calc_wvf_bb_batch.signatures)
+        for compiled, python in zip(*results):
+            np.testing.assert_allclose(python, compiled)
@@ -0,0 +1,76 @@
+import math
+import unittest
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from hummingbot.strategy.vixfix_scalper.vixfix_indicator import RollingMax, RollingStats, VixFixIndicator
+
+
+def rolling_last(values: np.ndarray, window: int, reducer) -> float:
+    return reducer(values[-window:]) if len(values) >= window else math.nan
+
+
+class VixFixIndicatorTest(unittest.TestCase):
+    PD = 22
+    BBL = 20
+    MULT = 2.0
+    LB = 50
+    PH = 0.85
+
+    def setUp(self) -> None:
+        rng = np.random.default_rng(7)
+        self.prices = 100 + np.cumsum(rng.normal(0, 1, 150))
+
+    def reference(self, prices: np.ndarray):
+        """Last values of the pandas rolling calculation the indicator replaces, over the last 100 prices"""
+        prices = prices[-100:]
+        if len(prices) < self.PD:
+            return math.nan, math.nan, math.nan, rolling_last(prices, 50, np.mean)
+        highest_close = sliding_window_view(prices, self.PD).max(axis=1)
+        wvf = (highest_close - prices[self.PD - 1:]) / highest_close * 100
+        upper_band = (rolling_last(wvf, self.BBL, np.mean)
+                      + self.MULT * rolling_last(wvf, self.BBL, lambda w: np.std(w, ddof=1)))
+        range_high = rolling_last(wvf, self.LB, np.max) * self.PH
+        return wvf[-1], upper_band, range_high, rolling_last(prices, 50, np.mean)
+
+    def assert_same(self, expected: float, actual: float):
+        if math.isnan(expected):
+            self.assertTrue(math.isnan(actual))
+        else:
+            self.assertAlmostEqual(expected, actual, places=9)
+
+    def test_matches_rolling_reference(self):
+        indicator = VixFixIndicator(self.PD, self.BBL, self.MULT, self.LB, self.PH)
+        for i, price in enumerate(self.prices):
+            indicator.update(float(price))
+            wvf, upper_band, range_high, sma = self.reference(self.prices[:i + 1])
+            self.assert_same(wvf, indicator.wvf)
+            self.assert_same(upper_band, indicator.upper_band)
+            self.assert_same(range_high, indicator.range_high)
+            self.assert_same(sma, indicator.sma)
+
+    def test_values_are_nan_until_windows_are_full(self):
+        indicator = VixFixIndicator(self.PD, self.BBL, self.MULT, self.LB, self.PH)
+        for price in self.prices[:self.PD - 1]:
+            indicator.update(float(price))
+
+        self.assertTrue(math.isnan(indicator.wvf))
+        self.assertTrue(math.isnan(indicator.upper_band))
+        self.assertFalse(indicator.wvf >= indicator.upper_band)
+
+    def test_rolling_max(self):
+        rolling_max = RollingMax(3)
+        results = [rolling_max.update(value) for value in [1.0, 5.0, 2.0, 1.0, 0.5, 3.0]]
+
+        self.assertTrue(all(math.isnan(r) for r in results[:2]))
+        self.assertEqual([5.0, 5.0, 2.0, 3.0], results[2:])
+
+    def test_rolling_stats(self):
+        stats = RollingStats(4)
+        values = self.prices[:45]
+        for value in values:
+            stats.update(float(value))
+
+        self.assertAlmostEqual(np.mean(values[-4:]), stats.mean)
+        self.assertAlmostEqual(np.std(values[-4:], ddof=1), stats.std)
@@ -0,0 +1,130 @@
+import unittest
+from decimal import Decimal
+from unittest.mock import MagicMock, patch
+
+from hummingbot.strategy.vixfix_scalper.vixfix_scalper import STOP_LOSS_ADJUST_INTERVAL, VixFixScalperStrategy
+
+
+class VixFixScalperStrategyTest(unittest.TestCase):
+    ENTRY_PRICES = ("101.37", "27345.61", "0.7731", "3.3333")
+    # Smallest price step of the tests, prices one step beyond an exit price must not trigger it
+    PRICE_STEP = Decimal("1e-8")
+
+    def setUp(self) -> None:
+        self.market = MagicMock()
+        self.market.ready = True
+        self.market.name = "binance_paper_trade"
+        self.market_info = MagicMock()
+        self.market_info.market = self.market
+        self.market_info.trading_pair = "BTC-USDT"
+
+        self.addCleanup(patch.stopall)
+        patch.object(VixFixScalperStrategy, "add_markets").start()
+        self.timestamp = 0.0
+
+    def create_strategy(self) -> VixFixScalperStrategy:
+        return VixFixScalperStrategy(
+            self.market_info,
+            base_order_amount=Decimal("0.01"),
+            profit_target_pct=Decimal("0.003"),
+        )
+
+    def tick(self, strategy: VixFixScalperStrategy, price: Decimal):
+        self.market_info.get_mid_price.return_value = price
+        self.timestamp += 2
+        strategy.tick(self.timestamp)
+
+    def enter_position(self, strategy: VixFixScalperStrategy, price: Decimal):
+        # A flat price history, long enough to trade but too short for an entry signal
+        for _ in range(strategy.pd):
+            self.tick(strategy, price)
+        strategy.enter_long()
+        self.assertTrue(strategy.in_position)
+
+    @staticmethod
+    def decimal_exit_prices(strategy: VixFixScalperStrategy, entry_price: Decimal):
+        risk_amount = min(
+            strategy.base_risk_amount * (Decimal("1") + Decimal("0.25") * strategy.consecutive_wins),
+            strategy.max_risk_amount
+        )
+        stop_loss_pct = float(risk_amount) / float(strategy.current_portfolio_value)
+        stop_loss_price = entry_price * (Decimal("1") - Decimal(str(stop_loss_pct)))
+        profit_target_price = entry_price * (Decimal("1") + Decimal("0.003"))
+        return stop_loss_price, profit_target_price
+
+    def test_stop_loss_fires_at_decimal_stop_price(self):
+        for wins in (0, 2, 7):
+            for entry in self.ENTRY_PRICES:
+                strategy = self.create_strategy()
+                strategy.consecutive_wins = wins
+                entry_price = Decimal(entry)
+                self.enter_position(strategy, entry_price)
+                stop_loss_price, _ = self.decimal_exit_prices(strategy, entry_price)
+                self.assertEqual(stop_loss_price, strategy.stop_loss_price)
+
+                self.tick(strategy, stop_loss_price + self.PRICE_STEP)
+                self.assertTrue(strategy.in_position)
+                self.tick(strategy, stop_loss_price)
+                self.assertFalse(strategy.in_position)
+                self.assertEqual(1, strategy.losing_trades)
+                self.assertEqual(0, strategy.consecutive_wins)
+
+    def test_profit_target_fires_at_decimal_target_price(self):
+        for entry in self.ENTRY_PRICES:
+            strategy = self.create_strategy()
+            entry_price = Decimal(entry)
+            self.enter_position(strategy, entry_price)
+            _, profit_target_price = self.decimal_exit_prices(strategy, entry_price)
+            self.assertEqual(profit_target_price, strategy.profit_target_price)
+
+            self.tick(strategy, profit_target_price - self.PRICE_STEP)
+            self.assertTrue(strategy.in_position)
+            self.tick(strategy, profit_target_price)
+            self.assertFalse(strategy.in_position)
+            self.assertEqual(1, strategy.winning_trades)
+            self.assertEqual(1, strategy.consecutive_wins)
+
+    def test_pnl_is_settled_in_decimal(self):
+        strategy = self.create_strategy()
+        self.enter_position(strategy, Decimal("101.37"))
+        # Profit target exit
+        self.tick(strategy, Decimal("101.71"))
+        self.tick(strategy, Decimal("101"))
+        strategy.enter_long()
+        # Stop loss exit
+        self.tick(strategy, Decimal("99"))
+
+        self.assertFalse(strategy.in_position)
+        self.assertEqual(2, strategy.total_trades)
+        self.assertIsInstance(strategy.total_realized_pnl, Decimal)
+        self.assertEqual(Decimal("0.0034") + Decimal("-0.02"), strategy.total_realized_pnl)
+
+    def test_risk_follows_consecutive_wins(self):
+        strategy = self.create_strategy()
+        for wins in range(7):
+            strategy.consecutive_wins = wins
+            risk_amount, stop_loss_pct = strategy._risk()
+
+            expected = min(Decimal("150") * (1 + Decimal("0.25") * wins), Decimal("300"))
+            self.assertEqual(float(expected), risk_amount)
+            self.assertEqual(float(expected) / 10000, stop_loss_pct)
+
+    def test_stop_loss_adjustment_is_throttled(self):
+        strategy = self.create_strategy()
+        self.enter_position(strategy, Decimal("100"))
+        adjust_timestamps = []
+        exit_checks = []
+        patch.object(strategy, "adjust_stop_loss", side_effect=lambda: adjust_timestamps.append(self.timestamp)).start()
+        patch.object(strategy, "check_exit_conditions", side_effect=lambda: exit_checks.append(self.timestamp)).start()
+
+        ticks = []
+        for _ in range(20):
+            self.tick(strategy, Decimal("100"))
+            ticks.append(self.timestamp)
+
+        self.assertEqual(ticks, exit_checks)
+        self.assertEqual(ticks[0], adjust_timestamps[0])
+        self.assertGreater(len(adjust_timestamps), 1)
+        for previous, current in zip(adjust_timestamps, adjust_timestamps[1:]):
+            self.assertGreaterEqual(current - previous, STOP_LOSS_ADJUST_INTERVAL)
+        self.assertLess(len(adjust_timestamps), len(ticks))
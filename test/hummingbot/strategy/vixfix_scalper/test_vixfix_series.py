@@ -0,0 +1,98 @@
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from hummingbot.core.utils.jit import NUMBA_AVAILABLE
+from hummingbot.strategy.vixfix_scalper.vixfix_indicator import VixFixIndicator
+from hummingbot.strategy.vixfix_scalper.vixfix_series import (
+    _vixfix_kernel,
+    _vixfix_windows,
+    compute_entry_signals,
+    compute_vixfix_series,
+)
+
+
+class VixFixSeriesTest(unittest.TestCase):
+    def setUp(self) -> None:
+        rng = np.random.default_rng(11)
+        self.prices = 100 + np.cumsum(rng.normal(0, 1, 200))
+
+    def test_matches_incremental_indicator(self):
+        series = compute_vixfix_series(self.prices)
+
+        indicator = VixFixIndicator()
+        for i, price in enumerate(self.prices):
+            indicator.update(float(price))
+            live = (indicator.wvf, indicator.upper_band, indicator.range_high, indicator.sma)
+            for expected, values in zip(live, series):
+                if np.isnan(expected):
+                    self.assertTrue(np.isnan(values[i]))
+                else:
+                    self.assertAlmostEqual(expected, values[i], places=9)
+
+    def test_long_series_matches_rolling_windows(self):
+        prices = 100 + np.cumsum(np.random.default_rng(5).normal(0, 1, 20000))
+        wvf, upper_band, range_high, sma = compute_vixfix_series(prices)
+
+        highest_close = sliding_window_view(prices, 22).max(axis=1)
+        expected_wvf = (highest_close - prices[21:]) / highest_close * 100
+        bb_windows = sliding_window_view(expected_wvf, 20)
+        expected_upper_band = bb_windows.mean(axis=1) + 2.0 * bb_windows.std(axis=1, ddof=1)
+        np.testing.assert_allclose(expected_wvf, wvf[21:], rtol=1e-9, atol=1e-9)
+        np.testing.assert_allclose(expected_upper_band, upper_band[40:], rtol=1e-9, atol=1e-9)
+        np.testing.assert_allclose(sliding_window_view(expected_wvf, 50).max(axis=1) * 0.85, range_high[70:])
+        np.testing.assert_allclose(sliding_window_view(prices, 50).mean(axis=1), sma[49:], rtol=1e-9)
+
+    def test_loop_and_window_implementations_agree(self):
+        # compute_vixfix_series picks one of them depending on whether Numba is installed
+        series = []
+        for fill in (_vixfix_kernel, _vixfix_windows):
+            outputs = [np.full(len(self.prices), np.nan) for _ in range(4)]
+            fill(self.prices, 22, 20, 2.0, 50, 0.85, 50, *outputs)
+            series.append(outputs)
+        for loop_values, window_values in zip(*series):
+            np.testing.assert_allclose(loop_values, window_values, rtol=1e-9, atol=1e-9)
+
+    @unittest.skipUnless(NUMBA_AVAILABLE, "Numba is not installed")
+    def test_compiled_kernel_matches_python(self):
+        series = []
+        for fill in (_vixfix_kernel, _vixfix_kernel.py_func):
+            outputs = [np.full(len(self.prices), np.nan) for _ in range(4)]
+            fill(self.prices, 22, 20, 2.0, 50, 0.85, 50, *outputs)
+            series.append(outputs)
+
+        self.assertTrue(_vixfix_kernel.signatures)
+        for compiled_values, python_values in zip(*series):
+            np.testing.assert_allclose(python_values, compiled_values, rtol=1e-12, atol=1e-12)
+
+    def test_entry_signals_match_incremental_check(self):
+        signals = compute_entry_signals(self.prices)
+
+        indicator = VixFixIndicator()
+        expected = []
+        for i, price in enumerate(self.prices):
+            indicator.update(float(price))
+            expected.append(i + 1 >= 50
+                            and price > indicator.sma
+                            and (indicator.wvf >= indicator.upper_band or indicator.wvf >= indicator.range_high))
+        self.assertEqual(expected, signals.tolist())
+        self.assertTrue(signals.any())
+
+    def test_entry_signals_do_not_depend_on_numba(self):
+        signals = compute_entry_signals(self.prices)
+        with patch("hummingbot.strategy.vixfix_scalper.vixfix_series.NUMBA_AVAILABLE", not NUMBA_AVAILABLE):
+            other_signals = compute_entry_signals(self.prices)
+
+        self.assertEqual(signals.tolist(), other_signals.tolist())
+
+    def test_short_series(self):
+        wvf, upper_band, range_high, sma = compute_vixfix_series(self.prices[:30])
+
+        self.assertEqual(30, len(wvf))
+        self.assertTrue(np.isnan(wvf[20]))
+        self.assertFalse(np.isnan(wvf[21]))
+        self.assertTrue(np.all(np.isnan(upper_band)))
+        self.assertTrue(np.all(np.isnan(range_high)))
+        self.assertTrue(np.all(np.isnan(sma)))